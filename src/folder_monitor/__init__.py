@@ -1,9 +1,32 @@
 """
 Folder Monitor - File monitoring daemon with plugin support.
 """
-from folder_monitor.daemon import FileMonitorDaemon
-from folder_monitor.base_plugin import FileProcessorPlugin, PluginManager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from folder_monitor.base_plugin import FileProcessorPlugin, PluginManager
+    from folder_monitor.daemon import FileMonitorDaemon
 
 __all__ = ['FileMonitorDaemon', 'FileProcessorPlugin', 'PluginManager']
 
 __version__ = '0.3.0'
+
+# Public name -> defining module. Imported on first access, so that running
+# folder_monitor.cli for stop/status loads neither watchdog nor the plugin
+# machinery.
+_LAZY_IMPORTS = {
+    'FileMonitorDaemon': 'folder_monitor.daemon',
+    'FileProcessorPlugin': 'folder_monitor.base_plugin',
+    'PluginManager': 'folder_monitor.base_plugin',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes only when they are used."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
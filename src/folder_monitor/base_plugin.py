@@ -2,20 +2,41 @@
 Base classes for file processing plugins.
 """
 import abc
+import copy
+import functools
 import logging
 import json
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, List
 import importlib
-import pkgutil
+import importlib.metadata
 import sys
 import os
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
+
+# Parsed config files keyed by path, stored with the (mtime_ns, size) they
+# were parsed at, so that unchanged files are not re-read and re-parsed on
+# every load and a changed file replaces its old entry.
+_PARSE_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+# Plugin classes found by PluginManager discovery, keyed by what was
+# searched (package name or entry point group) and the sys.path in effect.
+_DISCOVERY_CACHE: dict[tuple[str, tuple[str, ...]], list[type["FileProcessorPlugin"]]] = {}
+
+
+@functools.cache
 def get_config_dir() -> Path:
     """
     Get the standard configuration directory for hump-yard.
     
+    The location is decided once per process.
+    
     Returns:
         Path to the configuration directory.
     """
@@ -29,6 +50,48 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@functools.cache
+def _find_config_template(package_name: str) -> str | None:
+    """
+    Locate 'config.template.json' in a package.
+    
+    The result is cached per package so repeated lookups do not walk
+    importlib.resources again.
+    
+    Args:
+        package_name: Name of the package to search.
+        
+    Returns:
+        Template text, or None if the package ships no template.
+    """
+    from importlib.resources import files
+    template_path = files(package_name).joinpath('config.template.json')
+    if template_path.is_file():
+        return template_path.read_text(encoding='utf-8')
+    return None
+
+
+def _read_json_cached(path: Path) -> dict[str, Any]:
+    """
+    Read a JSON file, reusing the previous parse result if the file is unchanged.
+    
+    Args:
+        path: Path to the JSON file.
+        
+    Returns:
+        A private copy of the parsed data.
+    """
+    st = os.stat(path)
+    key = str(path)
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        data = cached[2]
+    else:
+        data = _json_loads(path.read_bytes())
+        _PARSE_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
 class FileProcessorPlugin(abc.ABC):
     """
     Abstract base class for all file processing plugins.
@@ -36,13 +99,25 @@ class FileProcessorPlugin(abc.ABC):
     Attributes:
         logger: Logger instance for the plugin.
         config: Plugin configuration dictionary.
+        supported_extensions: Lowercase file extensions (with leading dot) the
+            plugin can process, or None to accept any file. Compound
+            extensions such as '.tar.gz' are allowed. Files with other
+            extensions are filtered out before can_handle() is called.
     """
     
+    supported_extensions: ClassVar[frozenset[str] | None] = None
+    
     def __init__(self) -> None:
         """Initialize the plugin with a logger."""
-        self.logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.logger: logging.Logger = type(self)._cls_logger()
         self.config: Dict[str, Any] = {}
     
+    @classmethod
+    @functools.cache
+    def _cls_logger(cls) -> logging.Logger:
+        """Look up the logger named after the plugin class once per class."""
+        return logging.getLogger(cls.__name__)
+    
     @property
     @abc.abstractmethod
     def name(self) -> str:
@@ -92,14 +167,13 @@ class FileProcessorPlugin(abc.ABC):
         config_path = self.get_config_path()
         
         if not config_path.exists():
-            self.logger.info(f"Config not found for {self.name}, creating default at {config_path}")
+            self.logger.info("Config not found for %s, creating default at %s", self.name, config_path)
             self.create_default_config(config_path)
             
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = _read_json_cached(config_path)
         except Exception as e:
-            self.logger.error(f"Failed to load config for {self.name}: {e}")
+            self.logger.error("Failed to load config for %s: %s", self.name, e)
             self.config = self.default_config
 
     def create_default_config(self, path: Path) -> None:
@@ -125,15 +199,14 @@ class FileProcessorPlugin(abc.ABC):
                 else:
                     package_name = module_name
                 
-                from importlib.resources import files
-                template_path = files(package_name).joinpath('config.template.json')
+                template = _find_config_template(package_name)
                 
-                if template_path.is_file():
-                    self.logger.info(f"Found config template in {package_name}")
-                    path.write_text(template_path.read_text(encoding='utf-8'), encoding='utf-8')
+                if template is not None:
+                    self.logger.info("Found config template in %s", package_name)
+                    path.write_text(template, encoding='utf-8')
                     return
             except Exception as e:
-                self.logger.debug(f"Could not load template from package: {e}")
+                self.logger.debug("Could not load template from package: %s", e)
 
             # Fallback to default_config property
             self.logger.info("Using default_config property")
@@ -141,7 +214,7 @@ class FileProcessorPlugin(abc.ABC):
                 json.dump(self.default_config, f, indent=2, ensure_ascii=False)
                 
         except Exception as e:
-            self.logger.error(f"Failed to create default config for {self.name}: {e}")
+            self.logger.error("Failed to create default config for %s: %s", self.name, e)
 
     def get_watch_folders(self) -> List[Dict[str, Any]]:
         """
@@ -178,7 +251,32 @@ class FileProcessorPlugin(abc.ABC):
             True if processing was successful, False otherwise.
         """
         pass
-    
+
+    def process_batch(self, file_paths: list[str], config: dict[str, Any]) -> list[bool]:
+        """
+        Process several files that settled at about the same time.
+
+        Can be overridden in subclasses to share setup work (connections,
+        flushes) across a batch. The default calls process() for each file
+        and passes exceptions to on_error().
+
+        Args:
+            file_paths: Paths to the files to process.
+            config: Plugin-specific configuration parameters.
+
+        Returns:
+            One flag per file, True if processing it was successful.
+        """
+        results = []
+        for file_path in file_paths:
+            try:
+                results.append(self.process(file_path, config))
+            except Exception as e:
+                self.logger.error("Exception while processing %s: %s", file_path, e, exc_info=True)
+                self.on_error(file_path, e)
+                results.append(False)
+        return results
+
     def on_error(self, file_path: str, error: Exception) -> None:
         """
         Handle errors during file processing.
@@ -189,7 +287,7 @@ class FileProcessorPlugin(abc.ABC):
             file_path: Path to the file that caused the error.
             error: The exception that occurred.
         """
-        self.logger.error(f"Error processing {file_path}: {error}")
+        self.logger.error("Error processing %s: %s", file_path, error)
 
 
 class PluginManager:
@@ -221,77 +319,154 @@ class PluginManager:
             raise ValueError(f"Plugin '{plugin_instance.name}' already registered")
         
         self.plugins[plugin_instance.name] = plugin_instance
-        self.logger.info(f"Registered plugin: {plugin_instance.name} v{plugin_instance.version}")
+        self.logger.info("Registered plugin: %s v%s", plugin_instance.name, plugin_instance.version)
+    
+    @staticmethod
+    def clear_discovery_cache() -> None:
+        """Forget discovered plugin classes so the next discovery scans again."""
+        _DISCOVERY_CACHE.clear()
+    
+    def _register_all(self, plugin_classes: list[type[FileProcessorPlugin]]) -> None:
+        """
+        Register several plugin classes, logging failures instead of raising.
+        
+        Args:
+            plugin_classes: Plugin classes to register.
+        """
+        for plugin_class in plugin_classes:
+            try:
+                self.register_plugin(plugin_class)
+            except Exception as e:
+                self.logger.error("Error registering plugin %s: %s", plugin_class.__name__, e)
     
     def discover_plugins(self, package_name: str) -> None:
         """
         Automatically discover plugins in a package.
         
+        The package is scanned once per sys.path; later calls reuse the
+        classes found by the first scan that completed without errors.
+        
         Args:
             package_name: Name of the package to search for plugins.
         """
+        key = (package_name, tuple(sys.path))
+        plugin_classes = _DISCOVERY_CACHE.get(key)
+        if plugin_classes is None:
+            plugin_classes, complete = self._scan_package(package_name)
+            if complete:
+                _DISCOVERY_CACHE[key] = plugin_classes
+        self._register_all(plugin_classes)
+    
+    def _scan_package(self, package_name: str) -> tuple[list[type[FileProcessorPlugin]], bool]:
+        """
+        Import the modules of a package and collect their plugin classes.
+        
+        Args:
+            package_name: Name of the package to search for plugins.
+            
+        Returns:
+            Plugin classes found in the package, and whether every module
+            could be scanned.
+        """
+        plugin_classes: list[type[FileProcessorPlugin]] = []
+        complete = True
         try:
             package = importlib.import_module(package_name)
             if package.__file__ is None:
-                self.logger.warning(f"Package {package_name} has no __file__ attribute")
-                return
+                self.logger.warning("Package %s has no __file__ attribute", package_name)
+                return plugin_classes, complete
             
-            package_path = Path(package.__file__).parent
+            package_path = os.path.dirname(package.__file__)
             
-            for _, module_name, is_pkg in pkgutil.iter_modules([str(package_path)]):
-                if is_pkg:
-                    continue
-                
+            # Plain top-level .py modules only; private modules are skipped
+            with os.scandir(package_path) as entries:
+                module_names = sorted(
+                    entry.name[:-3] for entry in entries
+                    if entry.name.endswith('.py')
+                    and not entry.name.startswith('_')
+                    and entry.is_file()
+                )
+            
+            for module_name in module_names:
                 full_module_name = f"{package_name}.{module_name}"
-                self._load_plugins_from_module(full_module_name)
+                module_classes, loaded = self._load_plugins_from_module(full_module_name)
+                plugin_classes.extend(module_classes)
+                complete = complete and loaded
                 
-        except ImportError as e:
-            self.logger.error(f"Error discovering plugins in {package_name}: {e}")
+        except (ImportError, OSError) as e:
+            self.logger.error("Error discovering plugins in %s: %s", package_name, e)
+            complete = False
+        return plugin_classes, complete
     
-    def _load_plugins_from_module(self, module_name: str) -> None:
+    def _load_plugins_from_module(self, module_name: str) -> tuple[list[type[FileProcessorPlugin]], bool]:
         """
-        Load plugins from a module.
+        Load plugin classes from a module.
         
         Args:
             module_name: Name of the module to load plugins from.
+            
+        Returns:
+            Plugin classes defined in the module, and whether it could be
+            imported.
         """
+        plugin_classes: list[type[FileProcessorPlugin]] = []
         try:
-            module = importlib.import_module(module_name)
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
             
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                
+            # Iterate the namespace directly rather than sorting dir() and
+            # looking every name up again with getattr()
+            for attr in list(vars(module).values()):
                 if (isinstance(attr, type) and 
                     issubclass(attr, FileProcessorPlugin) and 
-                    attr != FileProcessorPlugin):
-                    
+                    attr is not FileProcessorPlugin and
                     # Only register plugins defined in this module, not imported ones
-                    if attr.__module__ != module_name:
-                        continue
-
-                    self.register_plugin(attr)
+                    attr.__module__ == module_name):
+                    
+                    plugin_classes.append(attr)
                     
         except Exception as e:
-            self.logger.error(f"Error loading plugins from {module_name}: {e}")
+            self.logger.error("Error loading plugins from %s: %s", module_name, e)
+            return plugin_classes, False
+        return plugin_classes, True
     
     def discover_external_plugins(self) -> None:
-        """Discover plugins from external packages via entry points."""
-        try:
-            import importlib.metadata
-            
-            # Python 3.10+ has stable entry_points API with select method
-            eps = importlib.metadata.entry_points()
-            discovered_plugins = eps.select(group='folder_monitor.plugins')
+        """
+        Discover plugins from external packages via entry points.
+        
+        Entry points are read and loaded once per sys.path; later calls reuse
+        the classes unless some entry point failed to load.
+        """
+        group = 'folder_monitor.plugins'
+        key = (f"entry_points:{group}", tuple(sys.path))
+        plugin_classes = _DISCOVERY_CACHE.get(key)
+        if plugin_classes is None:
+            plugin_classes, complete = self._load_entry_points(group)
+            if complete:
+                _DISCOVERY_CACHE[key] = plugin_classes
+        self._register_all(plugin_classes)
+    
+    def _load_entry_points(self, group: str) -> tuple[list[type[FileProcessorPlugin]], bool]:
+        """
+        Load plugin classes advertised by installed distributions.
+        
+        Args:
+            group: Entry point group to load.
             
-            for entry_point in discovered_plugins:
-                try:
-                    plugin_class = entry_point.load()
-                    self.register_plugin(plugin_class)
-                except Exception as e:
-                    self.logger.error(f"Error loading plugin from entry point {entry_point.name}: {e}")
-                    
-        except (ImportError, AttributeError) as e:
-            self.logger.warning(f"Entry points not supported or error occurred: {e}")
+        Returns:
+            Plugin classes that could be loaded, and whether all entry points
+            loaded.
+        """
+        plugin_classes: list[type[FileProcessorPlugin]] = []
+        complete = True
+        # Selecting by group directly skips building the full entry point
+        # list of every installed distribution
+        for entry_point in importlib.metadata.entry_points(group=group):
+            try:
+                plugin_classes.append(entry_point.load())
+            except Exception as e:
+                self.logger.error("Error loading plugin from entry point %s: %s", entry_point.name, e)
+                complete = False
+        return plugin_classes, complete
     
     def get_plugin(self, name: str) -> FileProcessorPlugin | None:
         """
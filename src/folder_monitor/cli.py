@@ -2,9 +2,12 @@
 Command-line interface for hump-yard file monitoring daemon
 """
 import argparse
+import functools
 import sys
 import os
+import select
 import signal
+import subprocess
 import time
 import logging
 from pathlib import Path
@@ -12,14 +15,63 @@ from typing import Optional
 
 if sys.platform == 'win32':
     import ctypes
+    import msvcrt
+    from ctypes import wintypes
+else:
+    import fcntl
 
-from folder_monitor.daemon import FileMonitorDaemon
+# Windows process access rights
+PROCESS_TERMINATE = 0x0001
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+SYNCHRONIZE = 0x00100000
+ERROR_ACCESS_DENIED = 5
+WAIT_OBJECT_0 = 0
 
+# Not available on Windows, where os.open() descriptors are non-inheritable anyway
+_O_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
 
+# Byte locked with msvcrt.locking() on Windows. It lies past the PID text
+# because a locked region cannot be read by other processes there.
+_WIN_LOCK_OFFSET = 1024
+
+# A status/stop/start probe holds the PID file lock for a moment too, so a
+# starting daemon retries a few times before deciding another one is running
+_LOCK_ATTEMPTS = 5
+_LOCK_RETRY_DELAY = 0.02
+
+# PID file descriptor held open by the running daemon to keep its lock
+_PID_FD: Optional[int] = None
+
+
+@functools.cache
+def _kernel32() -> "ctypes.WinDLL":
+    """
+    Load kernel32 with typed prototypes for the functions used here.
+    
+    Loaded with use_last_error=True so ctypes.get_last_error() is reliable.
+    
+    Returns:
+        The kernel32 library handle.
+    """
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    kernel32.TerminateProcess.argtypes = (wintypes.HANDLE, wintypes.UINT)
+    kernel32.TerminateProcess.restype = wintypes.BOOL
+    kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    return kernel32
+
+
+@functools.cache
 def get_pid_file() -> Path:
     """
     Get the path to the PID file.
     
+    The location is decided once per process.
+    
     Returns:
         Path to the PID file.
     """
@@ -41,33 +93,102 @@ def read_pid() -> Optional[int]:
     Returns:
         PID if file exists and is valid, None otherwise.
     """
-    pid_file = get_pid_file()
-    if not pid_file.exists():
+    try:
+        fd = os.open(get_pid_file(), os.O_RDONLY | _O_CLOEXEC)
+    except OSError:
         return None
     
     try:
-        pid = int(pid_file.read_text().strip())
-        return pid
+        return int(os.read(fd, 32).strip())
     except (ValueError, OSError):
         return None
+    finally:
+        os.close(fd)
+
+
+def _try_lock(fd: int, shared: bool = False) -> bool:
+    """
+    Lock an open PID file without blocking.
+    
+    Args:
+        fd: Descriptor of the PID file.
+        shared: Take a shared lock, which is enough to test for the daemon's
+            exclusive one. Windows only has exclusive locks.
+        
+    Returns:
+        True if the lock was taken, False if another process holds it.
+    """
+    try:
+        if sys.platform == 'win32':
+            os.lseek(fd, _WIN_LOCK_OFFSET, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
 
 
-def write_pid(pid: int) -> None:
+def write_pid(pid: int) -> bool:
     """
-    Write PID to PID file.
+    Lock the PID file and write PID to it.
+    
+    The file is created if needed and kept open and locked until the
+    process exits, so the lock is released even if the process is killed.
     
     Args:
         pid: Process ID to write.
+        
+    Returns:
+        True on success, False if another daemon holds the lock.
     """
-    pid_file = get_pid_file()
-    pid_file.write_text(str(pid))
+    global _PID_FD
+    fd = os.open(get_pid_file(), os.O_RDWR | os.O_CREAT | _O_CLOEXEC, 0o644)
+    for attempt in range(_LOCK_ATTEMPTS):
+        if _try_lock(fd):
+            break
+        if attempt + 1 < _LOCK_ATTEMPTS:
+            time.sleep(_LOCK_RETRY_DELAY)
+    else:
+        os.close(fd)
+        return False
+    
+    os.ftruncate(fd, 0)
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.write(fd, str(pid).encode())
+    _PID_FD = fd
+    return True
 
 
-def remove_pid_file() -> None:
-    """Remove PID file."""
-    pid_file = get_pid_file()
-    if pid_file.exists():
-        pid_file.unlink()
+def is_pid_file_locked() -> bool:
+    """
+    Check whether a running daemon holds the PID file lock.
+    
+    The check briefly takes the lock itself; write_pid() retries for a
+    moment so that a daemon starting at the same time does not give up.
+    
+    Returns:
+        True if the lock is held, False if the file is missing or stale.
+        
+    Raises:
+        OSError: If the PID file exists but cannot be opened.
+    """
+    # Read access is enough for both flock() and msvcrt.locking(), so a PID
+    # file owned by another user can still be checked
+    try:
+        fd = os.open(get_pid_file(), os.O_RDONLY | _O_CLOEXEC)
+    except FileNotFoundError:
+        return False
+    
+    try:
+        if not _try_lock(fd, shared=True):
+            return True
+        if sys.platform == 'win32':
+            os.lseek(fd, _WIN_LOCK_OFFSET, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        return False
+    finally:
+        os.close(fd)
 
 
 def is_process_running(pid: int) -> bool:
@@ -82,25 +203,18 @@ def is_process_running(pid: int) -> bool:
     """
     try:
         if sys.platform == 'win32':
-            # Optimization: ctypes imported at module level
-            kernel32 = ctypes.windll.kernel32
-            # PROCESS_QUERY_INFORMATION = 0x0400
-            # PROCESS_VM_READ = 0x0010
-            
-            # Using OpenProcess with minimal rights to check existence
-            # 0x1000 is SYNCHRONIZE, which is enough to wait on it, but for checking existence
-            # we often use PROCESS_QUERY_LIMITED_INFORMATION (0x1000) on newer Windows
-            # or just 0 for some checks, but 0x0400 is standard for query info.
+            kernel32 = _kernel32()
             
-            handle = kernel32.OpenProcess(0x0400, 0, pid)
+            # PROCESS_QUERY_LIMITED_INFORMATION is meant for existence checks and,
+            # unlike PROCESS_QUERY_INFORMATION, is granted across integrity levels
+            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
             if handle:
                 kernel32.CloseHandle(handle)
                 return True
             
             # If OpenProcess failed, it might be because of permissions (Access Denied),
             # which means the process exists.
-            # GetLastError() == 5 (ERROR_ACCESS_DENIED)
-            if ctypes.GetLastError() == 5:
+            if ctypes.get_last_error() == ERROR_ACCESS_DENIED:
                 return True
                 
             return False
@@ -112,6 +226,165 @@ def is_process_running(pid: int) -> bool:
         return False
 
 
+def _win_terminate(pid: int) -> None:
+    """
+    Terminate a process on Windows via TerminateProcess.
+    
+    Args:
+        pid: Process ID to terminate.
+    """
+    kernel32 = _kernel32()
+    handle = kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+    if handle:
+        kernel32.TerminateProcess(handle, 1)
+        kernel32.CloseHandle(handle)
+
+
+def _wait_for_exit_event(pid: int, timeout: float) -> Optional[bool]:
+    """
+    Wait for a process to exit using a kernel exit notification.
+    
+    Uses a pidfd on Linux 5.3+ and an EVFILT_PROC kevent on BSD and macOS.
+    
+    Args:
+        pid: Process ID to wait for.
+        timeout: Maximum time to wait in seconds.
+        
+    Returns:
+        True if the process has exited, False on timeout, or None if no
+        exit notification is available on this system.
+    """
+    if hasattr(os, 'pidfd_open'):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # Kernel older than 5.3, or pidfds blocked by a seccomp filter
+            return None
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(int(timeout * 1000)))
+        finally:
+            os.close(fd)
+    
+    if hasattr(select, 'kqueue'):
+        kq = select.kqueue()
+        try:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT
+            )
+            try:
+                return bool(kq.control([event], 1, timeout))
+            except ProcessLookupError:
+                return True
+            except OSError:
+                return None
+        finally:
+            kq.close()
+    
+    return None
+
+
+def _wait_for_exit(pid: int, timeout: float = 5.0) -> bool:
+    """
+    Wait for a process to exit.
+    
+    On Windows this blocks on the process handle, and on Linux, BSD and
+    macOS on a kernel exit notification. Where neither is available the
+    process is polled with a delay growing from 10 ms to 200 ms.
+    
+    Args:
+        pid: Process ID to wait for.
+        timeout: Maximum time to wait in seconds.
+        
+    Returns:
+        True if the process has exited, False on timeout.
+    """
+    if sys.platform == 'win32':
+        kernel32 = _kernel32()
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return not is_process_running(pid)
+        try:
+            return kernel32.WaitForSingleObject(handle, int(timeout * 1000)) == WAIT_OBJECT_0
+        finally:
+            kernel32.CloseHandle(handle)
+    
+    exited = _wait_for_exit_event(pid, timeout)
+    if exited is not None:
+        return exited
+    
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while is_process_running(pid):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.2)
+    return True
+
+
+def _wait_for_start(process: subprocess.Popen, timeout: float = 5.0) -> Optional[int]:
+    """
+    Wait until a daemon has locked the PID file and written its PID.
+    
+    Polls with a short, growing delay and gives up early if the worker exits.
+    The PID is not compared with the spawned process: in a Windows venv,
+    python.exe is a launcher that runs the daemon as its own child.
+    
+    Args:
+        process: The spawned worker process.
+        timeout: Maximum time to wait in seconds.
+        
+    Returns:
+        PID of the running daemon, or None if it did not start.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while True:
+        if is_pid_file_locked():
+            pid = read_pid()
+            if pid:
+                return pid
+        if process.poll() is not None:
+            return None
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.2)
+
+
+def _wait_for_ready(process: subprocess.Popen, ready_fd: int, timeout: float = 30.0) -> Optional[int]:
+    """
+    Wait for a spawned worker to report through a pipe that it has started.
+    
+    Args:
+        process: The spawned worker process.
+        ready_fd: Read end of the pipe the worker writes to once its
+            observers are running. The write end must already be closed here.
+        timeout: Maximum time to wait in seconds. Setting up recursive
+            watches on large trees can take a while; a worker that dies is
+            noticed at once regardless.
+        
+    Returns:
+        PID of the running daemon, or None if the worker exited (the pipe
+        reached EOF) or did not report in time.
+    """
+    poller = select.poll()
+    poller.register(ready_fd, select.POLLIN)
+    if poller.poll(int(timeout * 1000)) and os.read(ready_fd, 1) == b'1':
+        return process.pid
+    return None
+
+
 def cmd_start(log_level: str, foreground: bool = False) -> None:
     """
     Start the daemon.
@@ -120,137 +393,153 @@ def cmd_start(log_level: str, foreground: bool = False) -> None:
         log_level: Logging level.
         foreground: Run in foreground (don't daemonize).
     """
-    # Check if already running
-    pid = read_pid()
-    if pid and is_process_running(pid):
-        print(f"Error: Daemon is already running (PID: {pid})", file=sys.stderr)
+    # Check if already running; the worker takes the lock itself, so two
+    # racing starts cannot both end up with a daemon
+    if is_pid_file_locked():
+        print(f"Error: Daemon is already running (PID: {read_pid()})", file=sys.stderr)
         sys.exit(1)
     
-    # Remove stale PID file
-    if pid:
-        remove_pid_file()
-    
     if foreground:
         # Run in foreground
         _run_daemon(log_level)
+        return
+    
+    # Daemonize by starting a detached worker process
+    python_exe = sys.executable
+    popen_kwargs: dict = {'stdin': subprocess.DEVNULL}
+    if sys.platform == 'win32':
+        if not python_exe.lower().endswith('pythonw.exe'):
+            # Try to find pythonw.exe in the same directory
+            python_dir = os.path.dirname(python_exe)
+            pythonw = os.path.join(python_dir, 'pythonw.exe')
+            if os.path.exists(pythonw):
+                python_exe = pythonw
+        popen_kwargs['creationflags'] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
     else:
-        # Daemonize
-        if sys.platform == 'win32':
-            # Windows: use pythonw or subprocess
-            import subprocess
-            python_exe = sys.executable
-            if not python_exe.lower().endswith('pythonw.exe'):
-                # Try to find pythonw.exe in the same directory
-                python_dir = os.path.dirname(python_exe)
-                pythonw = os.path.join(python_dir, 'pythonw.exe')
-                if os.path.exists(pythonw):
-                    python_exe = pythonw
-            
-            # Start detached process
-            args = [python_exe, '-m', 'folder_monitor.cli', 'start', '--internal-worker']
-            args.extend(['--log-level', log_level])
-            
-            subprocess.Popen(args, creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP)
-            time.sleep(1)  # Wait for process to start
-            
-            # Verify it started
-            pid = read_pid()
-            if pid and is_process_running(pid):
-                print(f"Daemon started successfully (PID: {pid})")
-            else:
-                print("Error: Failed to start daemon", file=sys.stderr)
-                sys.exit(1)
-        else:
-            # Unix: fork
-            pid = os.fork()
-            if pid > 0:
-                # Parent process
-                time.sleep(1)  # Wait for child to start
-                child_pid = read_pid()
-                if child_pid and is_process_running(child_pid):
-                    print(f"Daemon started successfully (PID: {child_pid})")
-                else:
-                    print("Error: Failed to start daemon", file=sys.stderr)
-                    sys.exit(1)
-                sys.exit(0)
-            
-            # Child process
-            os.setsid()
-            _run_daemon(log_level)
+        # Same effect as setsid() in a forked child, without duplicating
+        # this process' address space through fork()
+        popen_kwargs['start_new_session'] = True
+        popen_kwargs['close_fds'] = True
+    
+    args = [python_exe, '-m', 'folder_monitor.cli', 'start', '--internal-worker']
+    args.extend(['--log-level', log_level])
+    
+    if sys.platform == 'win32':
+        process = subprocess.Popen(args, **popen_kwargs)
+        pid = _wait_for_start(process)
+    else:
+        # The worker reports readiness through a pipe instead of being polled
+        # for; if it dies first, the pipe is closed and the wait ends at once
+        ready_r, ready_w = os.pipe()
+        try:
+            args.extend(['--ready-fd', str(ready_w)])
+            process = subprocess.Popen(args, pass_fds=(ready_w,), **popen_kwargs)
+            os.close(ready_w)
+            ready_w = -1
+            pid = _wait_for_ready(process, ready_r)
+        finally:
+            os.close(ready_r)
+            if ready_w != -1:
+                os.close(ready_w)
+    if pid:
+        print(f"Daemon started successfully (PID: {pid})")
+    else:
+        print("Error: Failed to start daemon", file=sys.stderr)
+        sys.exit(1)
 
 
-def _run_daemon(log_level: str) -> None:
+def _run_daemon(log_level: str, ready_fd: Optional[int] = None) -> None:
     """
     Internal function to run the daemon.
     
     Args:
         log_level: Logging level.
+        ready_fd: Pipe to write a byte to once the daemon is monitoring its
+            folders, used by cmd_start to learn that startup succeeded.
     """
-    # Write PID
-    write_pid(os.getpid())
+    # Lock the PID file for the lifetime of the process. It is not removed
+    # on exit: the lock, not the file, tells whether the daemon is running.
+    if not write_pid(os.getpid()):
+        print(f"Error: Daemon is already running (PID: {read_pid()})", file=sys.stderr)
+        sys.exit(1)
     
-    # Setup signal handlers
+    # Setup signal handlers for the startup phase; once running, the daemon
+    # installs its own handlers and returns from start() on shutdown
     def signal_handler(signum, frame):
-        remove_pid_file()
         sys.exit(0)
     
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
     
-    # Configure logging level
+    # Configure logging level. The format uses none of the thread, process or
+    # caller fields, so skip collecting them for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
     logging.basicConfig(
         level=getattr(logging, log_level),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    def report_ready() -> None:
+        if ready_fd is not None:
+            os.write(ready_fd, b'1')
+            os.close(ready_fd)
+    
     try:
-        # Create and start daemon
+        # Imported here so that stop/status do not pay for loading watchdog
+        from folder_monitor.daemon import FileMonitorDaemon
+        
+        # Create and start daemon; an exit before report_ready() closes the
+        # pipe, which cmd_start reports as a failed start
         daemon = FileMonitorDaemon()
-        daemon.start()
+        daemon.start(on_ready=report_ready)
     except Exception as e:
         logging.error(f"Daemon error: {e}", exc_info=True)
-        remove_pid_file()
         sys.exit(1)
 
 
 def cmd_stop() -> None:
     """Stop the daemon."""
-    pid = read_pid()
-    if not pid:
-        print("Daemon is not running (no PID file found)", file=sys.stderr)
+    if not is_pid_file_locked():
+        print("Daemon is not running", file=sys.stderr)
         sys.exit(1)
     
-    if not is_process_running(pid):
-        print(f"Daemon is not running (PID {pid} not found)", file=sys.stderr)
-        remove_pid_file()
+    pid = read_pid()
+    if not pid:
+        print("Error: Could not read daemon PID", file=sys.stderr)
         sys.exit(1)
     
     print(f"Stopping daemon (PID: {pid})...")
     
     try:
         if sys.platform == 'win32':
-            # Windows: use taskkill or ctypes
-            os.system(f'taskkill /PID {pid} /F >nul 2>&1')
+            # Windows: terminate directly instead of shelling out to taskkill
+            _win_terminate(pid)
         else:
             # Unix: send SIGTERM
             os.kill(pid, signal.SIGTERM)
         
         # Wait for process to stop
-        for _ in range(10):
-            time.sleep(0.5)
-            if not is_process_running(pid):
-                remove_pid_file()
-                print("Daemon stopped successfully")
-                return
+        if _wait_for_exit(pid, timeout=5.0):
+            print("Daemon stopped successfully")
+            return
         
         # Force kill if still running
         print("Warning: Daemon did not stop gracefully, force killing...")
         if sys.platform == 'win32':
-            os.system(f'taskkill /PID {pid} /F >nul 2>&1')
+            _win_terminate(pid)
         else:
             os.kill(pid, signal.SIGKILL)
         
-        remove_pid_file()
+        # The PID file lock is only released once the process is gone, so a
+        # following start (e.g. from restart) must not run before that
+        if not _wait_for_exit(pid, timeout=5.0):
+            print(f"Error: Daemon (PID: {pid}) is still running after being killed", file=sys.stderr)
+            sys.exit(1)
         print("Daemon force killed")
         
     except OSError as e:
@@ -265,32 +554,29 @@ def cmd_restart(log_level: str) -> None:
     Args:
         log_level: Logging level.
     """
-    pid = read_pid()
-    if pid and is_process_running(pid):
+    if is_pid_file_locked():
         cmd_stop()
-        time.sleep(1)
     
     cmd_start(log_level)
 
 
 def cmd_status() -> None:
     """Check daemon status."""
-    pid = read_pid()
-    if not pid:
-        print("Daemon is not running (no PID file found)")
-        sys.exit(3)
-    
-    if is_process_running(pid):
-        print(f"Daemon is running (PID: {pid})")
+    if is_pid_file_locked():
+        print(f"Daemon is running (PID: {read_pid()})")
         sys.exit(0)
     else:
-        print(f"Daemon is not running (stale PID file: {pid})")
-        remove_pid_file()
+        print("Daemon is not running")
         sys.exit(3)
 
 
-def main() -> None:
-    """Entry point for the folder-monitor console command."""
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+    
+    Returns:
+        The configured parser.
+    """
     parser = argparse.ArgumentParser(
         description='Folder Monitor - File monitoring daemon with plugin support',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -344,11 +630,22 @@ Examples:
         help=argparse.SUPPRESS
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--ready-fd',
+        type=int,
+        help=argparse.SUPPRESS
+    )
+    
+    return parser
+
+
+def main() -> None:
+    """Entry point for the folder-monitor console command."""
+    args = _build_parser().parse_args()
     
     try:
         if args.internal_worker:
-            _run_daemon(args.log_level)
+            _run_daemon(args.log_level, args.ready_fd)
         elif args.command == 'start':
             cmd_start(args.log_level, args.foreground)
         elif args.command == 'stop':
@@ -359,7 +656,6 @@ Examples:
             cmd_status()
     except KeyboardInterrupt:
         print("\nShutting down gracefully...")
-        remove_pid_file()
         sys.exit(0)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -1,29 +1,354 @@
 """
 File monitoring daemon with plugin support.
 """
+import math
+import os
+import re
+import signal
+import sys
+import threading
 import time
 import logging
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Hashable
 
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
+from watchdog.observers.api import BaseObserver
 
 from folder_monitor.base_plugin import PluginManager, FileProcessorPlugin
 
+# File systems on which inotify and friends do not see remote changes
+_NETWORK_FS_TYPES = frozenset({'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3'})
+
+# Seconds a new file must go without further events before it is processed
+SETTLE_DELAY = 0.5
+
+# Extra seconds the debouncer waits after the first file settles, so that
+# files from the same burst are handed to the plugin in one batch
+BATCH_WINDOW = 0.1
+
+# Maximum number of files passed to a plugin in one batch. Settled files are
+# spread over all workers first, so batches only get this large in big bursts.
+MAX_BATCH_SIZE = 256
+
+# Default cap on files waiting to settle, and separately on files in plugin
+# jobs queued or running, before event delivery is held back
+DEFAULT_MAX_PENDING = 1024
+
+# Default polling interval in seconds for folders on network file systems
+DEFAULT_POLL_INTERVAL = 60
+
+# Lock waits cannot be interrupted by Ctrl+C on Windows, so the main thread
+# wakes up periodically there to let signal handlers run. Elsewhere it blocks
+# until shutdown is requested.
+_STOP_WAIT_TIMEOUT = 1.0 if sys.platform == 'win32' else None
+
+# Seconds between shutdown checks while dispatch waits for a free slot
+_SLOT_WAIT_TIMEOUT = 0.2
+
+
+def _find_existing(paths: list[Path]) -> set[Path]:
+    """
+    Check which of the given paths exist.
+    
+    Paths are grouped by parent and each parent directory is listed once,
+    instead of stat-ing every path separately.
+    
+    Args:
+        paths: Paths to check.
+        
+    Returns:
+        The subset of paths that exist.
+    """
+    by_parent: defaultdict[Path, list[Path]] = defaultdict(list)
+    for path in paths:
+        by_parent[path.parent].append(path)
+    
+    existing = set()
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            names = set()
+        
+        for path in children:
+            # A miss may still be a case-insensitive match or a root path,
+            # so confirm it with a direct check
+            if path.name in names or path.exists():
+                existing.add(path)
+    return existing
+
+
+def _read_mount_table() -> list[tuple[str, str]]:
+    """
+    Read mount points and their file system types from /proc/mounts.
+    
+    Returns:
+        List of (mount point, file system type) pairs, most specific first.
+        Empty on platforms without /proc/mounts.
+    """
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    
+    # Later lines win: a file system mounted over an existing mount point
+    # (e.g. nfs4 on top of an autofs trigger) hides the earlier one
+    fs_types: dict[str, str] = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 3:
+            # Whitespace in mount points is octal-escaped, e.g. '\040' for a space
+            mount_point = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[1])
+            fs_types[mount_point] = fields[2]
+    return sorted(fs_types.items(), key=lambda m: len(m[0]), reverse=True)
+
+
+def _is_network_path(path: Path, mounts: list[tuple[str, str]]) -> bool:
+    """
+    Check whether a path lives on a network file system.
+    
+    Args:
+        path: Path to check.
+        mounts: Mount table as returned by _read_mount_table().
+        
+    Returns:
+        True if the path is on NFS, SMB/CIFS or a FUSE file system.
+    """
+    target = os.path.realpath(path)
+    for mount_point, fs_type in mounts:
+        if target == mount_point or target.startswith(mount_point.rstrip('/') + '/'):
+            return fs_type in _NETWORK_FS_TYPES or fs_type.startswith('fuse.')
+    return False
+
+
+def _merge_extensions(
+    folder: frozenset[str] | None,
+    supported: frozenset[str] | None
+) -> frozenset[str] | None:
+    """
+    Combine a folder's extension filter with a plugin's supported extensions.
+    
+    A compound extension such as '.tar.gz' on one side is kept if the other
+    side lists it or its last part ('.gz').
+    
+    Args:
+        folder: Normalized extensions configured for the folder, or None.
+        supported: Extensions supported by the plugin, or None.
+        
+    Returns:
+        Extensions accepted by both filters, or None if neither filters.
+    """
+    if folder is None or supported is None:
+        return supported if folder is None else folder
+    
+    def accepted_by(ext: str, other: frozenset[str]) -> bool:
+        return ext in other or '.' + ext.rpartition('.')[2] in other
+    
+    return frozenset(
+        [ext for ext in folder if accepted_by(ext, supported)]
+        + [ext for ext in supported if accepted_by(ext, folder)]
+    )
+
+
+class EventDebouncer:
+    """
+    Delays a callback until a key has seen no events for a given time.
+    
+    A single background thread serves all keys, so bursts of events do not
+    spawn a timer thread per file. Keys that settle within the batch window
+    of each other are passed to the callback together.
+    
+    Attributes:
+        delay: Quiet time in seconds before the callback fires for a key.
+        batch_window: Extra time in seconds to wait after the first key
+            settles, collecting other keys that settle meanwhile.
+        max_keys: Maximum number of pending keys. Adding a new key beyond it
+            blocks until the callback has taken some, or None for no limit.
+    """
+    
+    def __init__(
+        self,
+        delay: float,
+        callback: Callable[[list[Hashable]], None],
+        batch_window: float = 0.0,
+        max_keys: int | None = None
+    ) -> None:
+        """
+        Initialize the debouncer.
+        
+        Args:
+            delay: Quiet time in seconds before the callback fires for a key.
+            callback: Function called with a list of settled keys.
+            batch_window: Extra time in seconds to wait after the first key
+                settles, collecting other keys that settle meanwhile.
+            max_keys: Maximum number of pending keys. Adding a new key beyond
+                it blocks until the callback has taken some, or None for no
+                limit.
+        """
+        self.delay = delay
+        self.batch_window = batch_window
+        self.max_keys = max_keys
+        self._callback = callback
+        self._deadlines: dict[Hashable, float] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+        self.logger: logging.Logger = logging.getLogger("EventDebouncer")
+    
+    def touch(self, key: Hashable) -> None:
+        """
+        Schedule the callback for a key, or postpone it if already pending.
+        
+        Blocks while max_keys other keys are pending, which holds up the
+        caller (the observer thread) when dispatch falls behind.
+        
+        Args:
+            key: Key to schedule.
+        """
+        with self._condition:
+            while (
+                not self._stopped
+                and self.max_keys is not None
+                and len(self._deadlines) >= self.max_keys
+                and key not in self._deadlines
+            ):
+                self._condition.wait()
+            if self._stopped:
+                return
+            self._deadlines[key] = time.monotonic() + self.delay
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='fm-debouncer', daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+    
+    def extend(self, key: Hashable) -> None:
+        """
+        Postpone the callback for a key only if it is already pending.
+        
+        Args:
+            key: Key to postpone.
+        """
+        with self._condition:
+            if key in self._deadlines:
+                self._deadlines[key] = time.monotonic() + self.delay
+    
+    def discard(self, key: Hashable) -> bool:
+        """
+        Drop a pending key without firing the callback for it.
+        
+        Args:
+            key: Key to drop.
+            
+        Returns:
+            True if the key was pending.
+        """
+        with self._condition:
+            if self._deadlines.pop(key, None) is None:
+                return False
+            # Wake touch() calls waiting for room
+            self._condition.notify_all()
+            return True
+    
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop the background thread, dropping keys that have not settled yet.
+        
+        Blocked touch() calls return right away.
+        
+        Args:
+            wait: Wait for a callback that is still running to return.
+        """
+        with self._condition:
+            self._stopped = True
+            self._deadlines.clear()
+            self._condition.notify_all()
+        if wait and self._thread is not None:
+            self._thread.join()
+    
+    def _run(self) -> None:
+        """Wait for keys to settle and fire the callback for them."""
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopped:
+                        return
+                    now = time.monotonic()
+                    due = [key for key, deadline in self._deadlines.items() if deadline <= now]
+                    if due:
+                        for key in due:
+                            del self._deadlines[key]
+                        # Wake touch() calls waiting for room
+                        self._condition.notify_all()
+                        break
+                    timeout = (
+                        min(self._deadlines.values()) + self.batch_window - now
+                        if self._deadlines else None
+                    )
+                    self._condition.wait(timeout)
+            
+            try:
+                self._callback(due)
+            except Exception as e:
+                self.logger.error("Error dispatching %d settled keys: %s", len(due), e, exc_info=True)
+
 
 class PluginEventHandler(FileSystemEventHandler):
     """Handler for file system events specific to a plugin."""
     
-    def __init__(self, plugin: FileProcessorPlugin, config: dict) -> None:
+    def __init__(
+        self,
+        plugin: FileProcessorPlugin,
+        config: dict,
+        executor: Executor | None = None,
+        slots: threading.Semaphore | None = None,
+        debouncer: EventDebouncer | None = None,
+        stop_event: threading.Event | None = None
+    ) -> None:
         """
         Initialize the event handler.
         
         Args:
             plugin: The plugin instance to handle events.
             config: Configuration for the monitored folder.
+            executor: Executor to run the plugin on. If None, files are
+                processed synchronously on the observer thread.
+            slots: Semaphore with one unit per file in queued and running
+                jobs. When it is exhausted, dispatch blocks until a job
+                finishes.
+            debouncer: Debouncer that holds new files back until writes to
+                them have settled. If None, files are dispatched immediately.
+            stop_event: Set when the daemon shuts down. Dispatch then stops
+                waiting for slots and drops jobs instead of submitting them.
         """
         self.plugin = plugin
         self.config = config
+        self.executor = executor
+        self.slots = slots
+        self.debouncer = debouncer
+        self.stop_event = stop_event
+        # Last submitted job per path, used to keep jobs for one path in order
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Folder and plugin extension filters are merged and normalized once
+        # (lowercase, leading dot) so the per-event check is a single hash
+        # lookup; None means no filter. Compound extensions such as '.tar.gz'
+        # cannot be found by splitext and are matched as suffixes instead.
+        extensions = config.get('extensions')
+        ext_set = _merge_extensions(
+            frozenset('.' + ext.lower().lstrip('.') for ext in extensions) if extensions else None,
+            plugin.supported_extensions
+        )
+        self._ext_compound: tuple[str, ...] = tuple(
+            ext for ext in ext_set or () if ext.count('.') > 1
+        )
+        self._ext_set: frozenset[str] | None = ext_set
     
     def on_created(self, event: FileSystemEvent) -> None:
         """
@@ -33,21 +358,206 @@ class PluginEventHandler(FileSystemEventHandler):
             event: The file system event.
         """
         if not event.is_directory:
-            self._process_file(str(event.src_path))
+            file_path = str(event.src_path)
+            if not self.should_process_file(file_path):
+                return
+            if self.debouncer is None:
+                self._dispatch([file_path])
+            else:
+                self.debouncer.touch((self, file_path))
+    
+    def on_modified(self, event: FileSystemEvent) -> None:
+        """
+        Handle file modification events.
+        
+        A file that is still being written keeps postponing its processing.
+        
+        Args:
+            event: The file system event.
+        """
+        if not event.is_directory and self.debouncer is not None:
+            self.debouncer.extend((self, str(event.src_path)))
+    
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        """
+        Handle file deletion events.
+        
+        A file removed before it settled, e.g. a temporary file, is dropped.
+        
+        Args:
+            event: The file system event.
+        """
+        if not event.is_directory and self.debouncer is not None:
+            self.debouncer.discard((self, str(event.src_path)))
+    
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """
+        Handle file move events.
+        
+        The source is dropped like a deleted file. The destination is treated
+        as a new file if the source had not been picked up, so that the final
+        file of an atomic save (write to a temporary name, then rename) is
+        processed, but a file renamed by a plugin is not processed again.
+        
+        Args:
+            event: The file system event.
+        """
+        if event.is_directory:
+            return
+        src_path = str(event.src_path)
+        pending = self.debouncer is not None and self.debouncer.discard((self, src_path))
+        file_path = str(event.dest_path)
+        if not self.should_process_file(file_path):
+            return
+        if not pending and self.should_process_file(src_path):
+            return
+        if self.debouncer is None:
+            self._dispatch([file_path])
+        else:
+            self.debouncer.touch((self, file_path))
 
-    def _process_file(self, file_path: str) -> None:
-        """Process the file with the plugin."""
-        if self.plugin.can_handle(file_path):
-            self.plugin.logger.info(f"Processing {file_path}")
-            try:
-                success = self.plugin.process(file_path, self.config)
-                if success:
-                    self.plugin.logger.info(f"Successfully processed {file_path}")
+    def _dispatch(self, file_paths: list[str]) -> None:
+        """
+        Hand a batch of files over to the executor without blocking the observer thread.
+        
+        Paths that have no job queued or running are submitted together as one
+        job. A path that still has one is submitted on its own, after the
+        previous job for it has finished.
+        
+        Args:
+            file_paths: Paths to the files to process.
+        """
+        if self.executor is None:
+            self._process_batch(file_paths)
+            return
+        
+        jobs: list[tuple[list[str], Future | None, Future]] = []
+        with self._inflight_lock:
+            ready: list[str] = []
+            for file_path in file_paths:
+                previous = self._inflight.get(file_path)
+                if previous is None:
+                    ready.append(file_path)
                 else:
-                    self.plugin.logger.error(f"Failed to process {file_path}")
-            except Exception as e:
-                self.plugin.logger.error(f"Exception while processing {file_path}: {e}", exc_info=True)
+                    done: Future = Future()
+                    self._inflight[file_path] = done
+                    jobs.append(([file_path], previous, done))
+            if ready:
+                done = Future()
+                for file_path in ready:
+                    self._inflight[file_path] = done
+                jobs.append((ready, None, done))
+        
+        for paths, previous, done in jobs:
+            self._schedule(paths, previous, done)
+
+    def _schedule(self, file_paths: list[str], previous: Future | None, done: Future) -> None:
+        """Submit a job once the previous job for its path, if any, has finished."""
+        # Backpressure: hold up event dispatch while too much work is pending
+        if self.slots is not None and not self._acquire_slots(len(file_paths)):
+            self._finish_job(file_paths, done, cancelled=True, release_slots=False)
+            return
+        
+        def on_done(job: Future) -> None:
+            # Jobs dropped by shutdown(cancel_futures=True) never reach _run_job
+            if job.cancelled():
+                self._finish_job(file_paths, done, cancelled=True)
+        
+        def submit(_: Future | None = None) -> None:
+            # This may run from a cancellation inside executor.shutdown(), which
+            # holds the lock submit() needs, so check for shutdown first
+            if self._stopping():
+                self._finish_job(file_paths, done, cancelled=True)
+                return
+            try:
+                job = self.executor.submit(self._run_job, file_paths, done)
+            except RuntimeError:
+                # Executor is shut down; propagate the cancellation down the chain
+                self._finish_job(file_paths, done, cancelled=True)
+                return
+            job.add_done_callback(on_done)
+        
+        if previous is None:
+            submit()
+        else:
+            previous.add_done_callback(submit)
+
+    def _acquire_slots(self, count: int) -> bool:
+        """Take one slot per file, giving up without holding any if the daemon stops."""
+        for taken in range(count):
+            while not self.slots.acquire(timeout=_SLOT_WAIT_TIMEOUT):
+                if self._stopping():
+                    if taken:
+                        self.slots.release(taken)
+                    return False
+        return True
+    
+    def _stopping(self) -> bool:
+        """Check whether the daemon is shutting down."""
+        return self.stop_event is not None and self.stop_event.is_set()
+    
+    def _run_job(self, file_paths: list[str], done: Future) -> None:
+        """Process the files on a worker thread and release the next queued jobs."""
+        try:
+            self._process_batch(file_paths)
+        finally:
+            self._finish_job(file_paths, done)
+
+    def _finish_job(
+        self,
+        file_paths: list[str],
+        done: Future,
+        cancelled: bool = False,
+        release_slots: bool = True
+    ) -> None:
+        """Forget the job for paths it is still the latest one of and complete it."""
+        with self._inflight_lock:
+            for file_path in file_paths:
+                if self._inflight.get(file_path) is done:
+                    del self._inflight[file_path]
+        if self.slots is not None and release_slots:
+            self.slots.release(len(file_paths))
+        if cancelled:
+            done.cancel()
+        else:
+            done.set_result(None)
+
+    def should_process_file(self, file_path: str) -> bool:
+        """
+        Check the file against the folder's and the plugin's extension filters.
+        
+        Args:
+            file_path: Path to the file.
+            
+        Returns:
+            True if no filter applies or the extension matches.
+        """
+        if self._ext_set is None or os.path.splitext(file_path)[1].lower() in self._ext_set:
+            return True
+        return bool(self._ext_compound) and file_path.lower().endswith(self._ext_compound)
+
+    def _process_batch(self, file_paths: list[str]) -> None:
+        """Process the files the plugin can handle with a single plugin call."""
+        file_paths = [path for path in file_paths if self.plugin.can_handle(path)]
+        if not file_paths:
+            return
+        
+        logger = self.plugin.logger
+        for file_path in file_paths:
+            logger.info("Processing %s", file_path)
+        try:
+            results = self.plugin.process_batch(file_paths, self.config)
+        except Exception as e:
+            logger.error("Exception while processing %d files: %s", len(file_paths), e, exc_info=True)
+            for file_path in file_paths:
                 self.plugin.on_error(file_path, e)
+            return
+        
+        for file_path, success in zip(file_paths, results):
+            if success:
+                logger.info("Successfully processed %s", file_path)
+            else:
+                logger.error("Failed to process %s", file_path)
 
 
 class FileMonitorDaemon:
@@ -56,15 +566,53 @@ class FileMonitorDaemon:
     
     Attributes:
         plugin_manager: Plugin manager instance.
-        observers: List of watchdog observers.
+        observer: Watchdog observer shared by all folders on local file systems.
+        polling_observers: Polling observers for folders on network file
+            systems, keyed by polling interval.
+        max_workers: Number of plugin worker threads.
+        max_pending: Limit on files waiting to settle and on files in queued
+            or running plugin jobs.
+        executor: Thread pool running plugin processing off the observer thread.
+        debouncer: Holds new files back until writes to them have settled.
         logger: Logger instance.
     """
     
-    def __init__(self) -> None:
-        """Initialize the file monitor daemon."""
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING
+    ) -> None:
+        """
+        Initialize the file monitor daemon.
+        
+        Args:
+            max_workers: Number of plugin worker threads (default: CPU count).
+            max_pending: Maximum number of files waiting to settle, and of
+                files in plugin jobs queued or running, before event delivery
+                is held back.
+        """
+        # The backend import pulls in inotify/FSEvents bindings, so it is
+        # deferred until a daemon is actually created
+        from watchdog.observers import Observer
+        
         self.plugin_manager = PluginManager()
-        self.observers = []
+        self.observer = Observer()
+        self.polling_observers: dict[float, BaseObserver] = {}
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='fm-worker'
+        )
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.debouncer = EventDebouncer(
+            SETTLE_DELAY, self._dispatch_settled,
+            batch_window=BATCH_WINDOW, max_keys=max_pending
+        )
         self.logger: logging.Logger
+        self._stop_event = threading.Event()
+        self._stop_lock = threading.Lock()
+        self._stopped = False
         
         self.setup_logging()
         self.load_plugins()
@@ -88,53 +636,164 @@ class FileMonitorDaemon:
             try:
                 plugin.load_config()
             except Exception as e:
-                self.logger.error(f"Failed to load config for plugin {name}: {e}")
+                self.logger.error("Failed to load config for plugin %s: %s", name, e)
 
-        self.logger.info(f"Loaded plugins: {self.plugin_manager.list_plugins()}")
+        self.logger.info("Loaded plugins: %s", self.plugin_manager.list_plugins())
     
     def setup_observers(self) -> None:
         """Set up file system observers for all configured folders from all plugins."""
+        from watchdog.observers.polling import PollingObserver
+        
+        if isinstance(self.observer, PollingObserver):
+            # watchdog falls back to polling without notice when no native
+            # backend (inotify, FSEvents, kqueue, ReadDirectoryChangesW) loads
+            self.logger.warning(
+                "No native file system notification backend available, "
+                "falling back to polling; expect higher CPU usage on large folders"
+            )
+        
+        entries = []
         for name, plugin in self.plugin_manager.plugins.items():
             folders = plugin.get_watch_folders()
             for folder_config in folders:
                 path_str = folder_config.get('path')
-                if not path_str:
-                    continue
-                
-                path = Path(path_str)
-                if not path.exists():
-                    self.logger.warning(f"Folder does not exist: {path} (Plugin: {name})")
-                    continue
-                
-                recursive = folder_config.get('recursive', False)
-                
-                observer = Observer()
-                handler = PluginEventHandler(plugin, folder_config)
-                
-                observer.schedule(
-                    handler, 
-                    str(path), 
-                    recursive=recursive
-                )
-                self.observers.append(observer)
-                self.logger.info(f"Monitoring folder: {path} with plugin {name}")
+                if path_str:
+                    entries.append((name, plugin, folder_config, Path(path_str)))
+        
+        existing = _find_existing([path for *_, path in entries])
+        mounts = _read_mount_table()
+        
+        for name, plugin, folder_config, path in entries:
+            if path not in existing:
+                self.logger.warning("Folder does not exist: %s (Plugin: %s)", path, name)
+                continue
+            
+            recursive = folder_config.get('recursive', False)
+            
+            handler = PluginEventHandler(
+                plugin, folder_config, self.executor, self._slots, self.debouncer,
+                self._stop_event
+            )
+            
+            observer = self.observer
+            if _is_network_path(path, mounts):
+                # Native notifications miss changes made by other hosts
+                interval = self._poll_interval(folder_config, path)
+                observer = self.polling_observers.get(interval)
+                if observer is None:
+                    observer = PollingObserver(timeout=interval)
+                    self.polling_observers[interval] = observer
+                self.logger.info("%s is on a network file system, polling every %ss", path, interval)
+            
+            observer.schedule(
+                handler, 
+                str(path), 
+                recursive=recursive
+            )
+            self.logger.info("Monitoring folder: %s with plugin %s", path, name)
     
-    def start(self) -> None:
-        """Start the daemon and begin monitoring."""
+    def _poll_interval(self, folder_config: dict, path: Path) -> float:
+        """
+        Get a folder's polling interval, falling back to the default if invalid.
+        
+        Args:
+            folder_config: Configuration for the monitored folder.
+            path: Folder path, used in the warning.
+            
+        Returns:
+            A positive, finite interval in seconds.
+        """
+        value = folder_config.get('poll_interval', DEFAULT_POLL_INTERVAL)
+        try:
+            interval = float(value)
+        except (TypeError, ValueError):
+            interval = math.nan
+        if not (math.isfinite(interval) and interval > 0):
+            self.logger.warning(
+                "Invalid poll_interval %r for %s, using %ss",
+                value, path, DEFAULT_POLL_INTERVAL
+            )
+            interval = float(DEFAULT_POLL_INTERVAL)
+        return interval
+    
+    def _all_observers(self) -> list[BaseObserver]:
+        """Get the shared observer followed by any polling observers."""
+        return [self.observer, *self.polling_observers.values()]
+
+    def _dispatch_settled(self, keys: list[tuple[PluginEventHandler, str]]) -> None:
+        """
+        Group settled files by handler and dispatch them in batches.
+        
+        Each group is split into about one batch per worker, so that a burst
+        is still processed in parallel. A batch never needs more slots than
+        max_pending, or dispatching it would wait forever.
+        """
+        batches: dict[PluginEventHandler, list[str]] = defaultdict(list)
+        for handler, file_path in keys:
+            batches[handler].append(file_path)
+        for handler, file_paths in batches.items():
+            size = min(
+                MAX_BATCH_SIZE, self.max_pending,
+                -(-len(file_paths) // self.max_workers)
+            )
+            for i in range(0, len(file_paths), size):
+                handler._dispatch(file_paths[i:i + size])
+
+    def start(self, on_ready: Callable[[], None] | None = None) -> None:
+        """
+        Start the daemon and block until it is stopped.
+        
+        When called from the main thread, SIGINT and SIGTERM request a
+        graceful shutdown.
+        
+        Args:
+            on_ready: Called once all observers are running, e.g. to tell a
+                parent process that startup succeeded.
+        """
         self.logger.info("Starting File Monitor Daemon")
         
-        for observer in self.observers:
-            observer.start()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._handle_signal)
+            signal.signal(signal.SIGTERM, self._handle_signal)
         
         try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
+            # Fails here when inotify watch or instance limits are exhausted
+            for observer in self._all_observers():
+                observer.start()
+            # A failing callback (e.g. the parent already went away) must not
+            # leave the observers and worker threads behind
+            if on_ready is not None:
+                on_ready()
+        except Exception:
             self.stop()
+            raise
+        
+        while not self._stop_event.wait(_STOP_WAIT_TIMEOUT):
+            pass
+        self.stop()
+    
+    def _handle_signal(self, signum: int, frame: object) -> None:
+        """Wake up start(), which performs the actual shutdown."""
+        self._stop_event.set()
     
     def stop(self) -> None:
-        """Stop the daemon and all observers."""
+        """Stop the daemon and all observers. Makes a blocking start() return."""
+        self._stop_event.set()
+        with self._stop_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        
         self.logger.info("Stopping File Monitor Daemon")
-        for observer in self.observers:
+        # Release observer threads blocked in touch() before waiting for them
+        self.debouncer.stop(wait=False)
+        observers = self._all_observers()
+        for observer in observers:
             observer.stop()
-            observer.join()
+        # Drop queued plugin jobs up front; only running ones are waited for
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for observer in observers:
+            if observer.is_alive():
+                observer.join()
+        self.debouncer.stop()
+        self.executor.shutdown(wait=True, cancel_futures=True)
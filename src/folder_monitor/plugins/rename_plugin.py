@@ -6,6 +6,7 @@ from folder_monitor.base_plugin import FileProcessorPlugin
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
+import time
 
 
 class RenamePlugin(FileProcessorPlugin):
@@ -13,6 +14,12 @@ class RenamePlugin(FileProcessorPlugin):
     Plugin for renaming files.
     """
     
+    def __init__(self) -> None:
+        """Initialize the plugin and its timestamp cache."""
+        super().__init__()
+        # (epoch second, format, formatted timestamp) of the last rename
+        self._timestamp_cache: tuple[int, str, str] | None = None
+    
     @property
     def name(self) -> str:
         return "rename"
@@ -37,15 +44,19 @@ class RenamePlugin(FileProcessorPlugin):
     
     def can_handle(self, file_path: str) -> bool:
         """
-        Check if the file exists.
+        Accept any file.
+        
+        The event that triggered the call already reports the file as
+        created; if it disappears before processing, rename() fails and
+        process() reports the error.
         
         Args:
             file_path: Path to the file to check.
             
         Returns:
-            True if the file exists, False otherwise.
+            Always True.
         """
-        return Path(file_path).exists()
+        return True
     
     def process(self, file_path: str, config: Dict[str, Any]) -> bool:
         """
@@ -70,16 +81,39 @@ class RenamePlugin(FileProcessorPlugin):
             timestamp_format = config.get('timestamp_format', '%Y%m%d_%H%M%S')
             
             # Create new filename
-            timestamp = datetime.now().strftime(timestamp_format)
+            timestamp = self._format_timestamp(timestamp_format)
             new_name = f"{prefix}{timestamp}_{file_path_obj.name}"
             new_path = file_path_obj.parent / new_name
             
             # Rename file
-            self.logger.info(f"Renaming {file_path_obj.name} to {new_name}")
+            self.logger.info("Renaming %s to %s", file_path_obj.name, new_name)
             file_path_obj.rename(new_path)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to rename {file_path}: {e}")
+            self.logger.error("Failed to rename %s: %s", file_path, e)
             return False
+
+    def _format_timestamp(self, timestamp_format: str) -> str:
+        """
+        Format the current time, reusing the result within the same second.
+        
+        Formats with sub-second precision (%f) are always formatted anew.
+        
+        Args:
+            timestamp_format: strftime format string.
+            
+        Returns:
+            The formatted timestamp.
+        """
+        now = time.time()
+        second = int(now)
+        cached = self._timestamp_cache
+        if cached is not None and cached[0] == second and cached[1] == timestamp_format:
+            return cached[2]
+        
+        timestamp = datetime.fromtimestamp(now).strftime(timestamp_format)
+        if '%f' not in timestamp_format:
+            self._timestamp_cache = (second, timestamp_format, timestamp)
+        return timestamp